@@ -6,7 +6,7 @@ import altair as alt
 import numpy as np
 from utils.app_session import AppSession
 from utils.data_processor import counts_by_opening
-from utils.ui import add_header_with_slider, get_time_control_tabs, load_validate_df, setup_global_page, time_filter_controls
+from utils.ui import add_header_with_slider, get_time_control_tabs, load_validate_df, select_scope, select_time_class, setup_global_page, time_filter_controls
 
 st.set_page_config(page_title="ChessCom Analyzer • Dashboard", page_icon="📊", layout="wide")
 PAGE_ID = "Dashboard"
@@ -21,7 +21,7 @@ def _daily_last(df: pd.DataFrame) -> pd.DataFrame:
          .loc[:, ["end_time_local", "user_rating", "opponent_rating", "time_class"]]
          .copy())
     d["date"] = d["end_time_local"].dt.normalize()
-    return (d.groupby(["time_class", "date"], as_index=False)
+    return (d.groupby(["time_class", "date"], as_index=False, observed=True)
               .agg(user_rating=("user_rating", "last"),
                    opponent_rating=("opponent_rating", "mean")))
 
@@ -92,17 +92,19 @@ def _rating_progress_daily(df: pd.DataFrame, title: str, multi: bool) -> alt.Cha
 
 
 def _kpi(df:pd.DataFrame):
-    # KPIs
+    # KPIs: win/draw/loss in one pass over the category codes (missing results are code -1)
     total = len(df)
-    win_rate = (df["user_result_simple"] == "win").sum() / total if total else 0.0
-    draw_rate = (df["user_result_simple"] == "draw").sum() / total if total else 0.0
-    loss_rate = (df["user_result_simple"] == "loss").sum() / total if total else 0.0
+    wins, draws, losses = np.bincount(df["user_result_simple"].cat.codes.to_numpy() + 1, minlength=4)[1:]
+    win_rate = wins / total if total else 0.0
+    draw_rate = draws / total if total else 0.0
+    loss_rate = losses / total if total else 0.0
     
     avg_opp = df["opponent_rating"].mean()
 
-    # simple rated delta: last minus first by end_time within rated games
-    rated = df[df["rated"] == True].sort_values("end_time_local")
-    rated_delta = (rated["user_rating"].iloc[-1] - rated["user_rating"].iloc[0]) if len(rated) >= 2 else 0
+    # simple rated delta: last minus first by end_time within rated games, no full sort needed
+    rated = df.loc[df["rated"] == True, ["end_time_local", "user_rating"]]
+    t = rated["end_time_local"]
+    rated_delta = (rated["user_rating"].iloc[t.argmax()] - rated["user_rating"].iloc[t.argmin()]) if t.count() >= 2 else 0
 
     c1,c2,c3,c4,c5,c6 = st.columns(6)
     c1.metric("Games", len(df), border=True)
@@ -147,8 +149,7 @@ def _render_viz(df: pd.DataFrame, tab_name: str, multi: bool = False):
 
     _kpi(df)
 
-    w_counts = counts_by_opening(df, "opening_name", "w")
-    b_counts = counts_by_opening(df, "opening_name", "b")
+    w_counts, b_counts = counts_by_opening(df, "opening_name")
     show_opening_kpis("White", get_best_worst_openings(w_counts))
     show_opening_kpis("Black", get_best_worst_openings(b_counts))
 
@@ -163,15 +164,13 @@ df = add_header_with_slider(df, "Dashboard")
 
 #--- Layout
 top_labels, classes = get_time_control_tabs(df)
-top_tabs = st.tabs(top_labels)
-with top_tabs[0]:
+cls = select_time_class(top_labels, classes, key_prefix=PAGE_ID)
+if cls == "all":
     _render_viz(df, "All", multi=True)
-
-for i, cls in enumerate(classes, start=1):
-    with top_tabs[i]:
-        scope = df[df["time_class"].str.lower().fillna("unknown") == cls]
-        if scope.empty:
-            st.info(f"No games in {cls.title()}.")
-            continue
+else:
+    scope = select_scope(df, cls)
+    if scope.empty:
+        st.info(f"No games in {cls.title()}.")
+    else:
         filtered = time_filter_controls(scope, key_prefix=f"tc_{cls}")
         _render_viz(filtered, tab_name=cls.title(), multi=False)
\ No newline at end of file
@@ -1,19 +1,19 @@
 from __future__ import annotations
+from dataclasses import dataclass, field
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 import streamlit as st
-from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Optional
 
 KEY_USERNAME = "cc_username"
 KEY_DF = "games_df"
 # Centralized keys
-class AppSession(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    
+# rebuilt from st.session_state on every rerun: a plain slotted dataclass, no pydantic validation
+@dataclass(slots=True)
+class AppSession:
     username: Optional[str] = None
-    games_df: pd.DataFrame = pd.DataFrame()
+    games_df: pd.DataFrame = field(default_factory=pd.DataFrame)
 
     @property
     def game_count(self) -> int:
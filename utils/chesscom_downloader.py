@@ -1,40 +1,93 @@
 # chesscom_downloader.py
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+import functools
 import json
 import logging
+import os
+import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import pandas as pd
 from pydantic import BaseModel, Field
 import requests
-from utils.models import GameModel, GameRow, MonthArchive, ProfileModel, StatsModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.models import GameRow
 from utils.openings_catalog import join_openings_to_games
-import io, re, json
-import pandas as pd
-import chess.pgn
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 
 logger = logging.getLogger("chesscom")
 
-# precompile once at module import
-_TAGS   = re.compile(r"^\[.*?\]\s*", re.S | re.M)       # tag pair section
-_COMMS  = re.compile(r"\{[^}]*\}")                      # {...}
-_VARS   = re.compile(r"\([^()]*\)")                     # ( ... )
-_NAGS   = re.compile(r"\$\d+")
-_WS     = re.compile(r"\s+")
-_MOVENO = re.compile(r"\d+\.(?:\.\.)?")                 # 12. or 12...
-_RESULT = re.compile(r"(1-0|0-1|1/2-1/2|\*)")
+try:
+    # optional, ~3x faster on the nested archive payloads; raises a ValueError subclass like json
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# RE2 patterns, applied column-wide with pyarrow.compute (see _parse_pgn)
+_TAGS   = r"^\[.*?\]\s*"                               # tag pair section
+_COMMS  = r"\{[^}]*\}"                                  # {...}
+_VARS   = r"\([^()]*\)"                                 # ( ... )
+_NAGS   = r"\$\d+"
+_MOVENO = r"\d+\.(?:\.\.)?"                             # 12. or 12...
+_RESULT = r"(1-0|0-1|1/2-1/2|\*)"
+# everything that is not a SAN token, fused so each PGN is scanned once
+_STRIP  = "(?ms)" + "|".join([_TAGS, _COMMS, _VARS, _NAGS, _MOVENO, _RESULT])
+_ECO    = r'(?m)^\[ECO\s+"(?P<eco>[^"]+)"\]'
+_CLK    = "%clk"                                         # literal marker, split without regex
+_CLK_VALUE = r"^\s+(?P<clk>[0-9:.\-]+)"
+_PARSED_COLUMNS = ("eco", "moves_san_json", "clocks_json", "n_plies")
+_UNUSED_ON_LOAD = ("eco_url", "game_url", "tournament_url", "username", "initial_setup_fen")
+_PARSE_BATCH_ROWS = 20_000                                # min rows per parse thread
+
+# columns of GameRow, typed like the cached frame
+_GAMES_SCHEMA = pa.schema([
+    ("end_time", pa.timestamp("ns", tz="UTC")),
+    ("username", pa.string()),
+    ("opponent_username", pa.string()),
+    ("user_played_as", pa.string()),
+    ("user_result", pa.string()),
+    ("user_result_simple", pa.string()),
+    ("opponent_result", pa.string()),
+    ("user_rating", pa.int64()),
+    ("opponent_rating", pa.int64()),
+    ("rated", pa.bool_()),
+    ("rules", pa.string()),
+    ("time_class", pa.string()),
+    ("time_control", pa.string()),
+    ("time_label", pa.string()),
+    ("initial_setup_fen", pa.string()),
+    ("game_url", pa.string()),
+    ("pgn", pa.string()),
+    ("eco_url", pa.string()),
+    ("tournament_url", pa.string()),
+])
 
 # ---------- Cache + HTTP ----------
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """One keep-alive session per process, sized for the archive thread pool. requests already asks for gzip."""
+    sess = requests.Session()
+    # transient gateway errors and dropped connections; 429 is handled with Retry-After in _fetch_conditional_json
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], allowed_methods=["GET"], raise_on_status=False)
+    sess.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return sess
+
 class IndexEntry(BaseModel):
     url: str
     etag: Optional[str] = None
     created_on: str = datetime.now().isoformat()
-    updated_on: Optional[str] = None
+    updated_on: Optional[datetime] = None  # parsed once when the index is loaded
 
-    def is_update_needed(self) -> bool:
-        return (self.updated_on is None
-                or datetime.fromisoformat(self.updated_on) < datetime.now() - timedelta(hours=24))
+    def is_update_needed(self, cutoff: Optional[datetime] = None) -> bool:
+        cutoff = cutoff or datetime.now() - timedelta(hours=24)
+        return self.updated_on is None or self.updated_on < cutoff
 
 class IndexModel(BaseModel):
     archives_list: IndexEntry
@@ -50,6 +103,8 @@ class ChesscomDownloader:
         timeout: float = 20.0,
         sleep_sec: float = 0.2,
         session: Optional[requests.Session] = None,
+        max_workers: int = 8,
+        max_retries: int = 3,
     ):
         self.cache_root = cache_root
         self.base_headers = {"User-Agent": f"chess.com Analyzer (+mailto:{contact_email})"}
@@ -57,7 +112,9 @@ class ChesscomDownloader:
         self.timezone = timezone
         self.timeout = timeout
         self.sleep_sec = sleep_sec
-        self.sess = session or requests.Session()
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.sess = session or _shared_session()
         self.cache_root.mkdir(parents=True, exist_ok=True)
 
     @property
@@ -74,25 +131,35 @@ class ChesscomDownloader:
 
     @property
     def games_path(self) -> Path:
+        return self.cache_dir / "games.feather"
+
+    @property
+    def legacy_games_path(self) -> Path:
         return self.cache_dir / "games.parquet"
 
     # ---------- public ----------
     def load_from_cache(self) -> pd.DataFrame:
-        df = self._read_parquet()
-        if df is None or df.empty:
+        schema = self._cache_schema()
+        if schema is None:
             return pd.DataFrame()
 
-        # ts with timezone column
-        if "end_time" in df.columns:
-            df["end_time_local"] = df["end_time"].dt.tz_convert(self.timezone)
+        # unused columns are never read from disk; the raw PGN only if it was not parsed at download time
+        parsed = all(c in schema.names for c in _PARSED_COLUMNS)
+        skip = _UNUSED_ON_LOAD + (("pgn",) if parsed else ())
+        tbl = self._read_table(columns=[c for c in schema.names if c not in skip])
+        if tbl is None or tbl.num_rows == 0:
+            return pd.DataFrame()
+        if not parsed:
+            tbl = _with_parsed_pgn(tbl)
 
-        # fast PGN parse
-        rows = [self._parse_pgn_min_fast(x) for x in df["pgn"].astype(str)]
-        pgn_cols = pd.json_normalize(rows)
-        df = pd.concat([df.drop(columns=["pgn"]), pgn_cols], axis=1)
+        # ts with timezone column; stored in UTC, so the cast only swaps the tz metadata
+        if "end_time" in tbl.column_names:
+            end_time = _as_utc(tbl["end_time"])
+            tbl = tbl.append_column("end_time_local", end_time.cast(pa.timestamp(end_time.type.unit, tz=self.timezone)))
 
-        # Remove unnecessary columns
-        df.drop(columns=["moves_normalized", "end_time", "eco_url", "game_url", "tournament_url", "username", "initial_setup_fen"], inplace=True)
+        # Remove consumed columns before conversion
+        tbl = tbl.drop_columns([c for c in ("pgn", "end_time") if c in tbl.column_names])
+        df = _to_pandas(tbl)
 
         # openings
         df = join_openings_to_games(df)
@@ -119,148 +186,137 @@ class ChesscomDownloader:
             try:
                 r = self.sess.get(self.archives_url, headers=headers, timeout=self.timeout)
                 if r.status_code == 200:
-                    urls = r.json().get("archives", [])
+                    urls = _json_loads(r.content).get("archives", [])
                     prev = {a.url: a for a in idx.archives}
                     idx.archives = []
                     for u in urls:
                         e = prev.get(u, IndexEntry(url=u))
                         idx.archives.append(e)
                     idx.archives_list.etag = r.headers.get("ETag")
-                    idx.archives_list.updated_on = datetime.now().isoformat()
+                    idx.archives_list.updated_on = datetime.now()
 
                 if r.status_code == 304:
                     logger.info(f"304 - archives not modified for {self.username}")
-                    idx.archives_list.updated_on = datetime.now().isoformat()
+                    idx.archives_list.updated_on = datetime.now()
                 if r.status_code == 404:
                     logger.warning(f"404 - user not found: {self.username}")
 
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 logger.exception(f"archives error: {e}")
 
-        # Iterate over each archive and check whether it needs update (only updated every 24 hours with etag)
-        rows: list[GameRow] = []
+        # Fetch archives that need an update (only updated every 24 hours with etag), a few months at a time
         total_archives = len(idx.archives)
-        for i, archive_idx in enumerate(idx.archives, start=1):
-            if not archive_idx.is_update_needed():
+        to_fetch: list[IndexEntry] = []
+        cutoff = datetime.now() - timedelta(hours=24)
+        for archive_idx in idx.archives:
+            if archive_idx.is_update_needed(cutoff):
+                to_fetch.append(archive_idx)
+            else:
                 logger.info(f"Skipping as no updated needed: {archive_idx.url}")
-                continue
-
-            data = self._fetch_conditional_json(archive_idx)
-            if data is None:
-                continue
-
-            archive = MonthArchive.model_validate({"games": data.get("games", [])})
-
-            logger.info(f"HTTP {len(archive.games)} games from {archive_idx.url}")
-
-            rows.extend(GameRow.from_game(g, self.username) for g in archive.games)
-            archive_idx.updated_on = datetime.now().isoformat()
-            if progress_cb: progress_cb(i, total_archives)
-
-        # Build dataframe of updated games
-        new_df = pd.DataFrame([r.model_dump() for r in rows]) if rows else pd.DataFrame()
-        if not new_df.empty:
-            new_df["end_time"] = pd.to_datetime(new_df["end_time"], utc=True)
-            for c in ["user_rating", "opponent_rating"]:
-                new_df[c] = pd.to_numeric(new_df[c], errors="coerce")
-
-        # Merge with existing parquet
-        existing = self._read_parquet()
-
-        if existing is None:
-            df_final = new_df
-        elif new_df.empty:
-            df_final = existing
+        done = total_archives - len(to_fetch)
+
+        fetched: dict[str, pa.RecordBatch] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._download_archive, a): a for a in to_fetch}
+            for fut in as_completed(futures):
+                batch = fut.result()
+                if batch is not None:
+                    fetched[futures[fut].url] = batch
+                done += 1
+                if progress_cb: progress_cb(done, total_archives)
+
+        # Build table of updated games; keep archive order, independent of completion order
+        batches = [fetched[a.url] for a in to_fetch if a.url in fetched]
+        # parse each game once, at download time; loads read the persisted columns
+        new_tbl = _with_parsed_pgn(pa.Table.from_batches(batches, schema=_GAMES_SCHEMA)) if batches else None
+
+        # Merge with existing cache; rows stay Arrow, only the key columns go through pandas
+        existing = self._read_games()
+        if existing is None or existing.num_rows == 0:
+            # cache is kept in end_time order, as the merge writes it
+            final = new_tbl.sort_by("end_time") if new_tbl is not None else None
+        elif new_tbl is None:
+            final = None if self.games_path.exists() else existing
         else:
-            existing["end_time"] = pd.to_datetime(existing["end_time"], utc=True, errors="coerce")
-
-            # Month-Replacement + Prefer new rows
-            upd_months = set(new_df["end_time"].dt.to_period("M"))
-            keep_mask = ~existing["end_time"].dt.to_period("M").isin(upd_months)
-            merged = pd.concat([existing[keep_mask], new_df], ignore_index=True, copy=False)
-
-            # Key mit Fallback, neue Versionen gewinnen
-            key = merged["game_url"].fillna(merged.get("pgn_url"))
-            merged = (
-                merged.assign(__key=key, __is_new=merged.index >= len(existing[keep_mask]))
-                .sort_values(["__key", "__is_new", "end_time"])
-                .drop_duplicates(subset="__key", keep="last")
-                .drop(columns=["__key", "__is_new"])
-                .sort_values("end_time")
-                .reset_index(drop=True)
-            )
-            df_final = merged
-
-        # Persist Parquet & Index
+            final = _merge_games(_conform(existing, new_tbl.schema), new_tbl)
+
+        # Persist games (Feather: near zero-cost to load on startup) & Index
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        if df_final is not None and not df_final.empty:
-            df_final.to_parquet(self.games_path, index=False)
+        if final is not None and final.num_rows:
+            # no pandas metadata: ArrowDtype list columns would not round-trip through it
+            feather.write_feather(final.replace_schema_metadata(), self.games_path, compression="lz4")
 
         self.index_path.write_text(idx.model_dump_json(indent=2), encoding="utf-8")
         return self.load_from_cache()
 
     # ---- internals ----
-    def _fast_san_from_pgn(self, pgn_text: str) -> list[str]:
-        if not pgn_text:
-            return []
-        s = _TAGS.sub("", pgn_text)         # drop header
-        s = _COMMS.sub(" ", s)              # drop {comments}
-        s = _VARS.sub(" ", s)               # drop (variations)
-        s = _NAGS.sub(" ", s)               # drop $n
-        s = _MOVENO.sub(" ", s)             # drop 12. or 12...
-        s = _RESULT.sub(" ", s)             # drop result
-        s = _WS.sub(" ", s).strip()
-        # tokens now are SAN or clocks, etc.; filter out clocks if present
-        toks = [t for t in s.split(" ") if not t.startswith("%clk")]
-        # also drop bare '+' or '#' artifacts if present
-        return [t for t in toks if t and t not in ["+", "#"]]
-
-    def _parse_pgn_min_fast(self, pgn_text: str) -> dict:
-        sans = self._fast_san_from_pgn(pgn_text)
-        # clocks straight from text; no parsing tree needed
-        clocks = re.findall(r"%clk\s+([0-9:.\-]+)", pgn_text)
-        # ECO header without full parse
-        eco = None
-        m = re.search(r'^\[ECO\s+"([^"]+)"\]', pgn_text, re.M)
-        if m:
-            eco = m.group(1)
-        moves_normalized = " ".join(
-            (f"{(i//2)+1}. {m}" if i % 2 == 0 else m) for i, m in enumerate(sans)
-        )
-        return {
-            "eco": eco,
-            "moves_normalized": moves_normalized,
-            "moves_san_json": sans,      # keep list; JSON-encode later if needed
-            "clocks_json": clocks,       # keep list
-            "n_plies": len(sans),
-        }
-
-    def _read_parquet(self) -> Optional[pd.DataFrame]:
-        if self.games_path.exists():
-            try:
-                df = pd.read_parquet(self.games_path)
-                if "end_time" in df.columns:
-                    df["end_time"] = pd.to_datetime(df["end_time"], utc=True)
-                return df
-            except Exception as e:
-                logger.warning(f"Parquet read failed {self.games_path}: {e}")
-                return None
+    def _download_archive(self, archive_idx: IndexEntry) -> Optional[pa.RecordBatch]:
+        data = self._fetch_conditional_json(archive_idx)
+        if data is None:
+            return None
+
+        games = data.get("games", [])
+        logger.info(f"HTTP {len(games)} games from {archive_idx.url}")
+
+        archive_idx.updated_on = datetime.now()
+        # one columnar batch per month, straight from the payload dicts; _GAMES_SCHEMA types the columns
+        return pa.RecordBatch.from_pylist([GameRow.from_game_dict(g, self.username) for g in games], schema=_GAMES_SCHEMA)
+
+    def _cache_schema(self) -> Optional[pa.Schema]:
+        try:
+            if self.games_path.exists():
+                with pa.OSFile(str(self.games_path)) as f:
+                    return pa.ipc.open_file(f).schema
+            if self.legacy_games_path.exists():
+                return pq.read_schema(self.legacy_games_path)
+        except Exception as e:
+            logger.warning(f"Games cache read failed {self.cache_dir}: {e}")
         return None
 
+    def _read_table(self, columns: Optional[list[str]] = None) -> Optional[pa.Table]:
+        try:
+            if self.games_path.exists():
+                return feather.read_table(self.games_path, columns=columns)
+            if self.legacy_games_path.exists():
+                # caches written before the Feather switch; rewritten as Feather on the next download
+                return pq.read_table(self.legacy_games_path, columns=columns)
+        except Exception as e:
+            logger.warning(f"Games cache read failed {self.cache_dir}: {e}")
+        return None
+
+    def _read_games(self) -> Optional[pa.Table]:
+        tbl = self._read_table()
+        if tbl is None:
+            return None
+        if not all(c in tbl.column_names for c in _PARSED_COLUMNS):
+            tbl = _with_parsed_pgn(tbl)
+        return tbl
+
     def _fetch_conditional_json(self, idx: IndexEntry) -> Optional[dict]:
         headers = dict(self.base_headers)
         if idx.etag:
             headers["If-None-Match"] = idx.etag
 
-        logger.info(f"GET {idx.url}")
-        try:
-            r = self.sess.get(idx.url, headers=headers, timeout=self.timeout)
-        except requests.RequestException as e:
-            logger.error(f"request error {idx.url}: {e}")
-            return None
+        for attempt in range(self.max_retries + 1):
+            logger.info(f"GET {idx.url}")
+            try:
+                r = self.sess.get(idx.url, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                logger.error(f"request error {idx.url}: {e}")
+                return None
+            if r.status_code != 429 or attempt == self.max_retries:
+                break
+
+            # rate limited: honor Retry-After, otherwise back off exponentially
+            retry_after = r.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else self.sleep_sec * 2 ** attempt
+            logger.warning(f"429 Too Many Requests, retrying {idx.url} in {delay:.1f}s")
+            time.sleep(delay)
 
         if r.status_code == 304:
             logger.info(f"304 (Not Modified) - {idx.url}")
+            # the cached rows are current: nothing to parse, and no new request for another 24h
+            idx.updated_on = datetime.now()
             return None
 
         if r.status_code == 200:
@@ -268,7 +324,7 @@ class ChesscomDownloader:
             idx.etag = r.headers.get("ETag")
             idx.created_on = datetime.now().isoformat()
             try:
-                return r.json()
+                return _json_loads(r.content)
             except ValueError:
                 logger.error(f"json parse error {idx.url}")
                 return None
@@ -283,3 +339,111 @@ class ChesscomDownloader:
 
         logger.warning(f"{r.status_code} {idx.url}")
         return None
+
+def _merge_games(existing: pa.Table, new: pa.Table) -> pa.Table:
+    """Month-Replacement + Prefer new rows: existing games outside the downloaded months, then the new ones."""
+    # months as year*12 + month integers, compared in Arrow; only the kept rows' keys reach pandas
+    upd_months = pc.unique(_month_number(new["end_time"]))
+    keep_pos = np.flatnonzero(pc.invert(pc.is_in(_month_number(existing["end_time"]), value_set=upd_months)).to_numpy(zero_copy_only=False))
+
+    keys = ["end_time", "game_url", "opponent_username", "user_played_as"]
+    old_k, new_k = existing.select(keys).take(keep_pos).to_pandas(), new.select(keys).to_pandas()
+    merged = pd.concat([old_k, new_k], ignore_index=True)
+
+    # Key mit Fallback, neue Versionen gewinnen; 8-byte hashes instead of concatenated strings
+    url_hash = pd.util.hash_pandas_object(merged["game_url"], index=False).to_numpy()
+    row_hash = pd.util.hash_pandas_object(merged[["end_time", "opponent_username", "user_played_as"]], index=False).to_numpy()
+    key = np.where(merged["game_url"].notna().to_numpy(), url_hash, row_hash)
+    merged = merged.assign(__key=key, __is_new=merged.index >= len(keep_pos))
+    # per key: rows of this download first, then the latest end_time; hash aggregates instead of a full sort
+    newest = merged[merged["__is_new"] == merged.groupby("__key", sort=False)["__is_new"].transform("max")]
+    keep_idx = newest.groupby("__key", sort=False)["end_time"].idxmax()
+    order = merged.loc[keep_idx, "end_time"].sort_values(kind="stable").index.to_numpy()
+
+    # merged row i came from existing row keep_pos[i], or from new row i - len(keep_pos)
+    src = np.concatenate([keep_pos, existing.num_rows + np.arange(new.num_rows)])
+    return pa.concat_tables([existing, new]).take(src[order])
+
+def _month_number(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pc.add(pc.multiply(pc.year(col), 12), pc.month(col))
+
+def _conform(tbl: pa.Table, schema: pa.Schema) -> pa.Table:
+    """tbl with the columns and types of schema (older caches); missing columns are null."""
+    cols = [tbl[f.name].cast(f.type) if f.name in tbl.column_names else pa.nulls(tbl.num_rows, f.type) for f in schema]
+    return pa.Table.from_arrays(cols, schema=schema)
+
+def _with_parsed_pgn(tbl: pa.Table) -> pa.Table:
+    """Append eco, SAN moves, clocks and ply count parsed from the pgn column (caches written before these were persisted)."""
+    for name, col in _parse_pgn(tbl["pgn"]).items():
+        tbl = tbl.append_column(name, col)
+    return tbl
+
+def _parse_pgn(pgn: pa.ChunkedArray) -> dict[str, pa.Array]:
+    """eco, SAN moves, clocks and ply count for every game, one Arrow kernel per pattern."""
+    arr = pc.fill_null(pgn.cast(pa.string()), "").combine_chunks()
+
+    # Arrow kernels release the GIL: big histories are parsed in row slices on a thread pool
+    n_workers = min(os.cpu_count() or 1, len(arr) // _PARSE_BATCH_ROWS)
+    if n_workers > 1:
+        step = -(-len(arr) // n_workers)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            parts = list(pool.map(_parse_pgn_batch, [arr.slice(i, step) for i in range(0, len(arr), step)]))
+        eco, sans, clocks = (pa.concat_arrays(list(p)) for p in zip(*parts))
+    else:
+        eco, sans, clocks = _parse_pgn_batch(arr)
+
+    return {
+        "eco": eco,
+        "moves_san_json": sans,
+        "clocks_json": clocks,
+        "n_plies": pc.list_value_length(sans).cast(pa.int64()),
+    }
+
+def _to_pandas(tbl: pa.Table) -> pd.DataFrame:
+    # list columns stay Arrow-backed; only the opening matcher needs them as Python lists
+    # strings become pyarrow-backed "string" instead of object columns of Python str
+    def _dtype(t: pa.DataType):
+        if pa.types.is_list(t):
+            return pd.ArrowDtype(t)
+        if pa.types.is_string(t) or pa.types.is_large_string(t):
+            return pd.StringDtype("pyarrow")
+        return None
+    return tbl.to_pandas(types_mapper=_dtype)
+
+def _parse_pgn_batch(arr: pa.StringArray) -> Tuple[pa.Array, pa.ListArray, pa.ListArray]:
+    """(eco, SAN moves, clocks) for a slice of PGN texts."""
+    # drop header, {comments}, (variations), $n, 12. or 12..., result
+    s = pc.replace_substring_regex(arr, pattern=_STRIP, replacement=" ")
+    # tokens now are SAN; drop empty splits and bare '+' / '#' artifacts
+    toks = pc.utf8_split_whitespace(s)
+    values = pc.list_flatten(toks)
+    keep = pc.invert(pc.or_(pc.is_in(values, value_set=pa.array(["", "+", "#"])),
+                            pc.starts_with(values, pattern="%clk")))
+    sans = _rebuild_lists(toks, keep)
+
+    # clocks straight from text: every piece after a '%clk' marker starts with whitespace + clock value
+    pieces = pc.split_pattern(arr, pattern=_CLK)
+    offsets = pieces.offsets.to_numpy()
+    parents = pc.list_parent_indices(pieces).to_numpy()
+    is_first = np.arange(len(parents)) == offsets[parents]
+    clk = pc.struct_field(pc.extract_regex(pc.list_flatten(pieces), pattern=_CLK_VALUE), "clk")
+    clocks = _rebuild_lists(pieces, pa.array(~is_first & pc.is_valid(clk).to_numpy(zero_copy_only=False)), clk)
+
+    eco = pc.struct_field(pc.extract_regex(arr, pattern=_ECO), "eco")
+    return eco, sans, clocks
+
+def _rebuild_lists(lists: pa.ListArray, keep: pa.BooleanArray, values: Optional[pa.Array] = None) -> pa.ListArray:
+    """Filter the flattened values of `lists` by `keep` and regroup them per row."""
+    values = pc.list_flatten(lists) if values is None else values
+    parents = pc.list_parent_indices(lists).to_numpy()
+    counts = np.bincount(parents[keep.to_numpy(zero_copy_only=False)], minlength=len(lists))
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    return pa.ListArray.from_arrays(pa.array(offsets), values.filter(keep))
+
+def _as_utc(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Timestamps as UTC; naive values are taken as UTC (like pd.to_datetime(utc=True))."""
+    if col.type.tz is None:
+        return pc.assume_timezone(col, timezone="UTC")
+    if col.type.tz == "UTC":
+        return col  # as written by download_all
+    return col.cast(pa.timestamp(col.type.unit, tz="UTC"))
@@ -64,27 +64,33 @@ class GameRow(BaseModel):
 
     @staticmethod
     def from_game(g: GameModel, username: str) -> "GameRow":
-        if g.black.username != None and g.black.username.strip().lower() == username:
+        return GameRow(**GameRow.from_game_dict(g.model_dump(), username))
+
+    @staticmethod
+    def from_game_dict(g: dict, username: str) -> dict:
+        """Fields of from_game as a plain dict, straight from a raw archive game (bulk path, no models)."""
+        white, black = g.get("white") or {}, g.get("black") or {}
+        if black.get("username") != None and black["username"].strip().lower() == username:
             user_played_as = "b"
-            user_name = g.black.username
-            opponent_username = g.white.username
-            user_rating = g.black.rating
-            opponent_rating = g.white.rating
-            user_result = g.black.result
-            opponent_result = g.white.result
-        elif g.white.username != None and g.white.username.strip().lower() == username:
+            user_name = black.get("username")
+            opponent_username = white.get("username")
+            user_rating = black.get("rating")
+            opponent_rating = white.get("rating")
+            user_result = black.get("result")
+            opponent_result = white.get("result")
+        elif white.get("username") != None and white["username"].strip().lower() == username:
             user_played_as = "w"
-            user_name = g.white.username
-            opponent_username = g.black.username
-            user_rating = g.white.rating
-            opponent_rating = g.black.rating
-            user_result = g.white.result
-            opponent_result = g.black.result
+            user_name = white.get("username")
+            opponent_username = black.get("username")
+            user_rating = white.get("rating")
+            opponent_rating = black.get("rating")
+            user_result = white.get("result")
+            opponent_result = black.get("result")
         else:
             print("Something went wrong, skipping game.")
 
-        return GameRow(
-            end_time=datetime.fromtimestamp(g.end_time, tz=timezone.utc) if g.end_time else None,
+        return dict(
+            end_time=datetime.fromtimestamp(g["end_time"], tz=timezone.utc) if g.get("end_time") else None,
             username=user_name,
             opponent_username=opponent_username,
             user_played_as=user_played_as,
@@ -92,17 +98,17 @@ class GameRow(BaseModel):
             user_result_simple=GameRow.simplify_result(user_result),
             opponent_result=opponent_result,
             user_rating=user_rating,
-            rated=g.rated,
+            rated=g.get("rated", False),
             opponent_rating=opponent_rating,
-            rules=g.rules,
-            time_class=g.time_class,
-            time_control=g.time_control,
-            time_label=GameRow.format_time_label(g.time_control),
-            initial_setup_fen=g.initial_setup,
-            game_url=g.url,
-            eco_url=g.eco,
-            tournament_url=g.tournament,
-            pgn=g.pgn,
+            rules=g.get("rules"),
+            time_class=g.get("time_class"),
+            time_control=g.get("time_control"),
+            time_label=GameRow.format_time_label(g.get("time_control")),
+            initial_setup_fen=g.get("initial_setup"),
+            game_url=g.get("url"),
+            eco_url=g.get("eco"),
+            tournament_url=g.get("tournament"),
+            pgn=g.get("pgn"),
         )
     
     @staticmethod
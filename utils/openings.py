@@ -0,0 +1,67 @@
+from typing import Literal
+import streamlit as st
+import pandas as pd
+import altair as alt
+from utils.data_processor import counts_by_opening
+from utils.ui import toast_once_page
+
+def _chart_top(counts: pd.DataFrame, column_name:Literal["opening_fullname", "opening_name"], title_prefix: str, top_n: int = 10):
+    # counts arrive ordered by games desc (see render_openings_viz)
+    top = counts.head(top_n)
+    row_height = 50
+    chart = (
+        alt.Chart(top)
+        .mark_bar()
+        .encode(
+            y=alt.Y(f"{column_name}:N", sort="-x", title=None,
+                    axis=alt.Axis(labelLimit=600)),
+            x=alt.X("games:Q", title="# Games"),
+            color=alt.Color("win_rate:Q", scale=alt.Scale(scheme="blues")),
+            tooltip=[
+                column_name,
+                alt.Tooltip("eco:N", title="ECO"),
+                "games","win","draw","loss",
+                alt.Tooltip("win_rate:Q", format=".1%")
+            ],
+        )
+    ).properties(
+        height=row_height * len(top),
+        title=f"{title_prefix}: Top {top_n} openings (win rate color)"
+    )
+    return chart
+
+
+def render_openings_viz(df: pd.DataFrame, column_name:Literal["opening_fullname", "opening_name"], page_id: str):
+    """Top openings per color as bar charts and tables."""
+    # info toast once
+    missing = int(df[column_name].isna().sum())
+    if missing > 0:
+        toast_once_page(page_id, "missing_opening", f"Ignored {missing} games with missing opening.", "ℹ️")
+    df = df.dropna(subset=[column_name])
+
+    w_counts, b_counts = counts_by_opening(df, column_name)
+
+    if w_counts.empty and b_counts.empty:
+        st.warning("No data available for the selected filters.")
+        st.stop()
+
+    c1, c2 = st.columns(2)
+    with c1:
+        if w_counts.empty:
+            st.info("No games as White.")
+        else:
+            w_top = w_counts.nlargest(100, "games")
+            st.altair_chart(_chart_top(w_top, column_name, "White"), use_container_width=True)
+            st.text("White — Top 100 openings")
+            cols = [column_name,"games","win_rate","win","draw","loss"]
+            st.dataframe(w_top[cols])
+
+    with c2:
+        if b_counts.empty:
+            st.info("No games as Black.")
+        else:
+            b_top = b_counts.nlargest(100, "games")
+            st.altair_chart(_chart_top(b_top, column_name, "Black"), use_container_width=True)
+            st.text("Black — Top 100 openings")
+            cols = [column_name,"games","win_rate","win","draw","loss"]
+            st.dataframe(b_top[cols])
@@ -1,30 +1,40 @@
+import functools
 import json
+import os
 import re
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional, List
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Any, Callable, Dict, Tuple, Optional, List
 
 _COMMENT = re.compile(r"\{[^}]*\}")
 _PARENS  = re.compile(r"\([^()]*\)")
-_MOVE_NO = re.compile(r"^\d+\.{1,3}$")                 # 1. or 1... or 23...
-_RESULTS = {"1-0", "0-1", "1/2-1/2", "*"}
+_NON_SAN = re.compile(r"(?<!\S)(?:\d+\.{1,3}|1-0|0-1|1/2-1/2|\*)(?!\S)")  # move numbers and results as whole tokens
+_END     = None                                       # trie key of a complete opening line
 
-def join_openings_to_games(df: pd.DataFrame):
-    openings = _load_openings_catalog()
-    
-    idx, max_key_len = _build_exact_index(openings, id_col="opening_id",
-                                        san_col="opening_moves_san_json", max_plies=80)
+def join_openings_to_games(df: pd.DataFrame, path: str = "data/openings.parquet"):
+    openings, trie = _opening_index(path, os.path.getmtime(path))
 
-    matches = df["moves_san_json"].apply(lambda x: _match_exact_longest(x, idx, max_key_len))
-    df["opening_id"], df["matched_plies"] = zip(*matches)
+    ids, plies = _match_exact_longest(_as_list_array(df["moves_san_json"]), trie)
+    df["opening_id"] = pd.arrays.IntegerArray(ids, ids < 0)
+    df["matched_plies"] = plies
 
-    # attach opening names if needed
-    df = df.merge(
-        openings[["opening_id","opening_name","opening_variation","opening_fullname","opening_moves_san_json"]],
-        on="opening_id", how="left"
-    )
+    # attach opening names: row positions in the catalog, then a take per column (no merge copy of df)
+    pos = openings.index.get_indexer(ids)
+    for c in ["opening_name","opening_variation","opening_fullname","opening_moves_san_json"]:
+        df[c] = pd.api.extensions.take(openings[c].to_numpy(), pos, allow_fill=True)
 
     return df
 
+@functools.lru_cache(maxsize=1)
+def _opening_index(path: str, mtime: float) -> Tuple[pd.DataFrame, tuple]:
+    """Catalog + trie, built once per process and catalog version (mtime is part of the key). Treat as read-only."""
+    openings = _load_openings_catalog(path).set_index("opening_id", drop=False)
+    trie = _build_exact_index(openings, id_col="opening_id",
+                              san_col="opening_moves_san_json", max_plies=80)
+    return openings, _trie_arrays(trie)
+
 def _ensure_list(x) -> List[str]:
     if isinstance(x, list): 
         return x
@@ -33,61 +43,108 @@ def _ensure_list(x) -> List[str]:
         except Exception: return []
     return []
 
+def _list_converter(col: pd.Series) -> Callable[[Any], List[str]]:
+    """Pick the list conversion once per column from its first value, not per element."""
+    sample = col.iloc[0] if len(col) else None
+    if isinstance(sample, list):
+        return lambda x: x or []
+    if isinstance(sample, str):
+        return json.loads
+    return _ensure_list
+
 def _build_exact_index(openings: pd.DataFrame,
                       id_col="opening_id",
                       san_col="moves_san_json",
                       max_plies: Optional[int] = None
-                     ) -> Tuple[Dict[tuple, int], int]:
+                     ) -> dict:
     """
-    Key = full opening SAN tuple; Value = opening_id.
+    Trie over the openings' full SAN move lists; nested dicts keyed by SAN,
+    the opening_id of a complete line sits under the _END key.
     If duplicates exist, keep the smallest id.
-    Returns (index, max_key_len).
     """
-    idx: Dict[tuple, int] = {}
-    max_len = 0
+    trie: dict = {}
+    to_list = _list_converter(openings[san_col])
     for oid, san_json in openings[[id_col, san_col]].itertuples(index=False):
-        sans = _ensure_list(san_json)
+        sans = to_list(san_json)
         if max_plies: sans = sans[:max_plies]
-        key = tuple(sans)
-        if not key: 
+        if not sans:
             continue
-        max_len = max(max_len, len(key))
-        if key not in idx or int(oid) < idx[key]:
-            idx[key] = int(oid)
-    return idx, max_len
-
-def _match_exact_longest(game_san_json,
-                        idx: Dict[tuple, int],
-                        max_key_len: int
-                       ) -> Tuple[Optional[int], int]:
+        node = trie
+        for san in sans:
+            node = node.setdefault(san, {})
+        if _END not in node or int(oid) < node[_END]:
+            node[_END] = int(oid)
+    return trie
+
+def _trie_arrays(trie: dict) -> Tuple[pa.Array, pd.Index, np.ndarray, np.ndarray]:
     """
-    Return (opening_id, matched_plies). Exact match against an opening’s full move list.
-    Longest prefix wins.
+    The trie as flat arrays over integer token ids: (vocab, edges, child, end_id).
+    Edge parent * len(vocab) + token leads to node child[i]; end_id is the opening_id ending at a node, -1 if none.
     """
-    sans = _ensure_list(game_san_json)
-    n = min(len(sans), max_key_len)
-    # search from longest to shortest
-    for k in range(n, 0, -1):
-        key = tuple(sans[:k])
-        if key in idx:
-            return idx[key], k
-    return None, 0
-
-def _san_list_from_pgn_like(text: str) -> list[str]:
-    if not isinstance(text, str) or not text.strip():
-        return []
-    s = _COMMENT.sub(" ", text)
-    # remove nested variations greedily
-    while "(" in s and ")" in s:
-        s = _PARENS.sub(" ", s)
-    s = re.sub(r"\s+", " ", s.strip())
-    toks = []
-    for t in s.split(" "):
-        t = t.strip()
-        if not t or _MOVE_NO.match(t) or t in _RESULTS:
-            continue
-        toks.append(t)
-    return toks
+    vocab: Dict[str, int] = {}
+    edges: List[Tuple[int, int]] = []
+    child: List[int] = []
+    end_id = [-1]                                        # node 0 is the root
+    stack = [(trie, 0)]
+    while stack:
+        node, nid = stack.pop()
+        for san, sub in node.items():
+            if san is _END:
+                continue
+            cid = len(end_id)
+            end_id.append(sub.get(_END, -1))
+            edges.append((nid, vocab.setdefault(san, len(vocab))))
+            child.append(cid)
+            stack.append((sub, cid))
+    keys = np.array([p * len(vocab) + t for p, t in edges], dtype=np.int64)
+    return pa.array(list(vocab), pa.string()), pd.Index(keys), np.asarray(child, dtype=np.int64), np.asarray(end_id, dtype=np.int64)
+
+def _as_list_array(col: pd.Series) -> pa.ListArray:
+    """SAN lists as one Arrow list array; Arrow-backed columns are passed through, older caches converted."""
+    if isinstance(col.dtype, pd.ArrowDtype):
+        arr = pa.array(col.array)
+    else:
+        to_list = _list_converter(col)
+        arr = pa.array([to_list(x) for x in col.tolist()], pa.list_(pa.string()))
+    return arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr
+
+def _match_exact_longest(sans: pa.ListArray, tries: tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (opening_id, matched_plies) per game, opening_id -1 if none. Exact match against an opening’s full move list.
+    Longest prefix wins; all games walk the trie together, one vectorized step per ply.
+    """
+    vocab, edges, child, end_id = tries
+    values = sans.values
+    tok = pc.fill_null(pc.index_in(values, value_set=vocab.cast(values.type)), -1).to_numpy()
+    starts = sans.offsets.to_numpy()[:-1]
+    lengths = pc.fill_null(pc.list_value_length(sans), 0).to_numpy()
+
+    node = np.zeros(len(sans), dtype=np.int64)
+    ids = np.full(len(sans), -1, dtype=np.int64)
+    plies = np.zeros(len(sans), dtype=np.int64)
+    active = np.flatnonzero(lengths > 0)
+    k = 0
+    while active.size:
+        t = tok[starts[active] + k]
+        pos = edges.get_indexer(node[active] * len(vocab) + t)
+        pos[t < 0] = -1                                  # SAN not in any opening line
+        active, pos = active[pos >= 0], pos[pos >= 0]
+        node[active] = child[pos]
+        k += 1
+        hit = active[end_id[node[active]] >= 0]
+        ids[hit] = end_id[node[hit]]
+        plies[hit] = k
+        active = active[lengths[active] > k]
+    return ids, plies
+
+def _san_lists_from_pgn_like(pgn: pd.Series) -> pd.Series:
+    """SAN tokens of PGN-like move text, for the whole column with pandas string kernels."""
+    s = pgn.str.replace(_COMMENT, " ", regex=True)
+    # remove nested variations, innermost first
+    while (inner := s.str.replace(_PARENS, " ", regex=True)).ne(s).any():
+        s = inner
+    s = s.str.replace(_NON_SAN, " ", regex=True)
+    return s.str.split()
 
 def _load_openings_catalog(path="data/openings.parquet") -> pd.DataFrame:
     cat = pd.read_parquet(path)
@@ -104,11 +161,9 @@ def _load_openings_catalog(path="data/openings.parquet") -> pd.DataFrame:
     cat["opening_name"] = sp[0].str.strip()
     cat["opening_variation"]    = sp[1].fillna("").str.strip()
 
-    # Moves to match later
-    cat["opening_moves_san_json"] = cat["pgn"].apply(
-        lambda x: json.dumps(_san_list_from_pgn_like(x))
-    )
+    # Moves to match later; kept as lists, the trie reads them without a JSON round trip
+    cat["opening_moves_san_json"] = _san_lists_from_pgn_like(cat["pgn"])
 
-    # key + ids
+    # key + ids (one per row, so rows are unique)
     cat["opening_id"] = cat.index.astype("int32")
-    return cat[["opening_id","eco","opening_name","opening_variation","opening_fullname","opening_moves_san_json"]].drop_duplicates()
+    return cat[["opening_id","eco","opening_name","opening_variation","opening_fullname","opening_moves_san_json"]]
@@ -0,0 +1,109 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.ui import toast_once_page
+
+DAY_NAMES = np.array(["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"])
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _share_bar_spec(tmp: pd.DataFrame, x_title: str | None, title: str) -> dict:
+    """Stacked win/draw/loss share bars as a Vega-Lite spec, cached on the aggregated frame."""
+    chart = (
+        alt.Chart(tmp)
+        .mark_bar()
+        .encode(
+            x=alt.X("label:N", title=x_title, sort=None, axis=alt.Axis(labelAngle=0)),
+            y=alt.Y("share:Q", title="Share (%)"),
+            color=alt.Color("user_result_simple:N", sort=["loss", "draw", "win"], title=None),
+            order=alt.Order("order_key:Q", sort="ascending"),
+        )
+        .properties(title=title)
+    )
+    # st.altair_chart also drops Altair's default theme before handing the spec to Streamlit
+    with alt.theme.enable("none"):
+        return chart.to_dict()
+
+def _result_shares(df: pd.DataFrame, dim: str) -> pd.DataFrame:
+    """Result share and game count per value of a small-range integer dimension (hour, weekday, month, year)."""
+    vals = df[dim].to_numpy(dtype="float64", na_value=np.nan)
+    valid = ~np.isnan(vals)
+    vals = vals[valid].astype(np.int64)
+    codes = df["user_result_simple"].cat.codes.to_numpy()[valid]
+    if vals.size == 0:
+        return pd.DataFrame({dim: pd.Series(dtype="int64"), "user_result_simple": df["user_result_simple"].iloc[0:0],
+                             "share": pd.Series(dtype="float64"), "n": pd.Series(dtype="int64")})
+
+    # joint (dim, result) histogram in one pass; games without a result only count towards n
+    lo = int(vals.min())
+    size = int(vals.max()) - lo + 1
+    n_cat = len(df["user_result_simple"].cat.categories)
+    n = np.bincount(vals - lo, minlength=size)
+    has_result = codes >= 0
+    flat = np.bincount((vals[has_result] - lo) * n_cat + codes[has_result], minlength=size * n_cat).reshape(size, n_cat)
+
+    # keep only occurring (dim, result) pairs, ordered by dim then result
+    d_idx, r_idx = np.nonzero(flat)
+    return pd.DataFrame({
+        dim: d_idx + lo,
+        "user_result_simple": pd.Categorical.from_codes(r_idx, dtype=df["user_result_simple"].dtype),
+        "share": flat[d_idx, r_idx] / flat.sum(axis=1)[d_idx],
+        "n": n[d_idx],
+    })
+
+def render_seasonality_viz(df: pd.DataFrame, page_id: str):
+    """Result shares by hour, weekday, month and year."""
+    missing = int(df["end_time_local"].isna().sum())
+    if missing > 0:
+        toast_once_page(page_id, "missing_timestamp", f"Ignored {missing} games with missing timestamp.", "ℹ️")
+
+    # --- derive extra columns into a new frame; the caller's df is not modified ---
+    t = df["end_time_local"].dt
+    df = pd.DataFrame({
+        "year": t.year,
+        "month": t.month,          # 1–12
+        "weekday": t.dayofweek,    # 0=Mon .. 6=Sun
+        "hour": t.hour,
+        "user_result_simple": df["user_result_simple"],
+    })
+
+    # ---- Aggregations ----
+    # Hour
+    tmp = _result_shares(df, "hour")
+    tmp["label"] = tmp["hour"].astype(str) + " (" + tmp["n"].astype(str) + ")"
+
+    tmp["hour"] = tmp["hour"].astype("Int64").astype(str)
+    tmp["share"] = tmp["share"]*100
+    tmp["order_key"] = tmp["user_result_simple"].cat.codes
+
+    st.vega_lite_chart(spec=_share_bar_spec(tmp, "Hours", "Hour of the day performance"), use_container_width=True)
+
+    # Weekday
+    weekday_long = _result_shares(df, "weekday")
+    # names only for the (at most 7) aggregated days, not per game
+    weekday_long["weekday_name"] = DAY_NAMES[weekday_long["weekday"].to_numpy(dtype="int64")]
+    weekday_long["label"] = weekday_long["weekday_name"] + " (" + weekday_long["n"].astype(str) + ")"
+    weekday_long["share"] = weekday_long["share"] * 100
+    weekday_long["order_key"] = weekday_long["user_result_simple"].cat.codes
+
+    st.vega_lite_chart(spec=_share_bar_spec(weekday_long, None, "Day of the week performance"), use_container_width=True)
+
+    # Month
+    tmp = _result_shares(df, "month")
+    tmp["label"] = tmp["month"].astype(str) + " (" + tmp["n"].astype(str) + ")"
+
+    tmp["month"] = tmp["month"].astype("Int64").astype(str)
+    tmp["share"] = tmp["share"]*100
+    tmp["order_key"] = tmp["user_result_simple"].cat.codes
+
+    st.vega_lite_chart(spec=_share_bar_spec(tmp, "Months", "Month of the year performance"), use_container_width=True)
+        
+    # Year
+    tmp = _result_shares(df, "year")
+    tmp["label"] = tmp["year"].astype(str) + " (" + tmp["n"].astype(str) + ")"
+
+    tmp["year"] = tmp["year"].astype("Int64").astype(str)
+    tmp["share"] = tmp["share"]*100
+    tmp["order_key"] = tmp["user_result_simple"].cat.codes
+
+    st.vega_lite_chart(spec=_share_bar_spec(tmp, "Years", "Yearly performance"), use_container_width=True)
@@ -22,23 +22,28 @@ def _set_active_page(page_id: str):
         st.session_state[ap_key] = page_id
         st.session_state[v_key] = st.session_state.get(v_key, 0) + 1
 
+_PAGE_CSS = """
+<style>
+    .block-container {
+        padding-top: 2.5rem !important;
+        padding-left: 2rem !important;
+        padding-right: 2rem !important;
+    }
+    .stApp {
+        padding: 0 !important;
+        margin: 0 !important;
+    }
+</style>
+"""
+
+_SLIDER_CSS = """
+<style>
+div[data-testid="column"]:has(div[data-testid="stSelectSlider"]) { padding-top: 3rem; }
+</style>
+"""
+
 def _inject_global_page_styles():
-    st.markdown(
-        """
-        <style>
-            .block-container {
-                padding-top: 2.5rem !important;
-                padding-left: 2rem !important;
-                padding-right: 2rem !important;
-            }
-            .stApp {
-                padding: 0 !important;
-                margin: 0 !important;
-            }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_PAGE_CSS, unsafe_allow_html=True)
 
 def setup_global_page(page_id: str):
     _inject_global_page_styles()
@@ -55,17 +60,33 @@ def load_validate_df() -> pd.DataFrame:
         st.error("No user loaded. Go to 📥Load Games and load your games first.")
         st.stop()
 
-    return df.copy()
+    if not all(isinstance(df[c].dtype, pd.CategoricalDtype) for c in ("user_result_simple", "user_played_as", "time_label", "time_class")):
+        # normalize once and keep it in the session, so reruns and page switches reuse the typed frame.
+        # fixed category order doubles as the stacking order in charts (win, draw, loss)
+        df = df.copy()
+        df["user_result_simple"] = pd.Categorical(df["user_result_simple"], categories=["win", "draw", "loss"], ordered=True)
+        # two values; groupbys and masks on it work on int8 codes
+        df["user_played_as"] = pd.Categorical(df["user_played_as"], categories=["w", "b"])
+        # few distinct time controls; counted and filtered on codes by time_filter_controls
+        df["time_label"] = df["time_label"].astype("category")
+        # lowercase with "unknown" for missing, the keys of the time class tabs
+        df["time_class"] = df["time_class"].str.lower().fillna("unknown").astype("category")
+        session.games_df = df
+        session.persist()
+
+    # shared with the session: filter into a new frame before adding columns
+    return df
 
 
 def time_filter_controls(df_scope: pd.DataFrame, key_prefix: str) -> pd.DataFrame:
-    # counts sorted desc by default
-    s = df_scope["time_label"].astype("string")
+    # counts sorted desc by default; categorical, so labels absent from this scope come back with 0
+    s = df_scope["time_label"]
     counts = s.value_counts()
-    labels: list[str] = [str(x) for x in counts.index.tolist()]
-    counts_map: dict[str, int] = {str(k): int(v) for k, v in counts.items()}
+    counts = counts[counts > 0]
+    # pill text -> label, so the selection maps back without parsing the text
+    option_labels: dict[str, str] = {f"{k} ({int(v)})": str(k) for k, v in counts.items()}
 
-    options = [f"{lbl} ({counts_map[lbl]})" for lbl in labels]
+    options = list(option_labels)
     default = options  # select all
     selected_opts = st.pills(
             label="Time controls",
@@ -76,12 +97,15 @@ def time_filter_controls(df_scope: pd.DataFrame, key_prefix: str) -> pd.DataFram
             label_visibility="collapsed",
         )
 
-    selected_labels = [s.split(" (", 1)[0] for s in selected_opts]
+    selected_labels = [option_labels[o] for o in selected_opts if o in option_labels]
 
     if not selected_labels:
         return df_scope.iloc[0:0]
+    # all pills on (the default) and no rows without a label: nothing to filter
+    if len(set(selected_labels)) == len(option_labels) and counts.sum() == len(df_scope):
+        return df_scope
 
-    mask = df_scope["time_label"].astype(str).isin(selected_labels)
+    mask = s.isin(selected_labels)
     return df_scope[mask]
 
 def add_header_with_slider(df_scope: pd.DataFrame, header_title:str) -> pd.DataFrame:
@@ -93,35 +117,30 @@ def add_header_with_slider(df_scope: pd.DataFrame, header_title:str) -> pd.DataF
         return _add_year_slider(df_scope)
 
 def _add_year_slider(df_scope: pd.DataFrame) -> pd.DataFrame:
-    st.markdown("""
-    <style>
-    div[data-testid="column"]:has(div[data-testid="stSelectSlider"]) { padding-top: 3rem; }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # parse times
-    s_local = pd.to_datetime(df_scope["end_time_local"], errors="coerce").dt.tz_convert(None)
-    if s_local.dropna().empty:
-        return df_scope.copy()
-
-    min_p, max_p = s_local.min().to_period("M"), s_local.max().to_period("M")
-    months: list[pd.Period] = []
-    cur = min_p
-    while cur <= max_p:
-        months.append(cur)
-        cur += 1
-
-    labels = [p.strftime("%Y-%m") for p in months]
+    st.markdown(_SLIDER_CSS, unsafe_allow_html=True)
+
+    # UTC instants for month bins and filter masks; load_from_cache already typed the column, so usually no parse
+    col = df_scope["end_time_local"]
+    if isinstance(col.dtype, pd.DatetimeTZDtype):
+        t = col.dt.tz_convert("UTC")
+    else:
+        t = pd.to_datetime(col, errors="coerce", utc=True)
+    if t.dropna().empty:
+        return df_scope
+
+    s_local = t.dt.tz_convert(None)
+    months = pd.period_range(s_local.min().to_period("M"), s_local.max().to_period("M"), freq="M")
+    labels = months.strftime("%Y-%m").tolist()
     end_idx = len(labels) - 1
 
-    # timestamps for filtering
-    t = pd.to_datetime(df_scope["end_time_local"], errors="coerce", utc=True)
+    # sorted once; each range count is two binary searches instead of a full mask
+    t_sorted = s_local.dropna().sort_values()
+    # month starts plus the end of the last month; month i spans edges[i] .. edges[i + 1]
+    edges = pd.period_range(months[0], months[-1] + 1, freq="M").to_timestamp(how="start")
 
     def _count(si: int, ei: int) -> int:
-        start_ts = months[si].to_timestamp(how="start").tz_localize("UTC")
-        end_ts   = (months[ei] + 1).to_timestamp(how="start").tz_localize("UTC")
-        mask = (t >= start_ts) & (t < end_ts)
-        return int(mask.sum())
+        lo, hi = t_sorted.searchsorted(edges[[si, ei + 1]], side="left")
+        return int(hi - lo)
 
     # start with latest 12 months, then widen by 12 until >=1000 games or full range
     start_idx = max(0, end_idx - 11)
@@ -141,23 +160,44 @@ def _add_year_slider(df_scope: pd.DataFrame) -> pd.DataFrame:
     start_p, end_p = pd.Period(start_lbl, "M"), pd.Period(end_lbl, "M")
     start_ts = start_p.to_timestamp(how="start").tz_localize("UTC")
     end_ts   = (end_p + 1).to_timestamp(how="start").tz_localize("UTC")
-    return df_scope[(t >= start_ts) & (t < end_ts)].copy()
+    return df_scope[(t >= start_ts) & (t < end_ts)]
+
+_CLASS_ORDER = ("bullet", "blitz", "rapid", "daily", "classical")
 
 def _order_classes(classes):
-    order = ["bullet", "blitz", "rapid", "daily", "classical"]
-    lower = [c.lower() if isinstance(c, str) else "unknown" for c in classes]
-    seen = set()
-    ordered = [c for c in order if c in lower and not (c in seen or seen.add(c))]
-    rest = [c for c in lower if c not in seen]
-    return ordered + sorted(rest)
+    lower = {c.lower() if isinstance(c, str) else "unknown" for c in classes}
+    return [c for c in _CLASS_ORDER if c in lower] + sorted(lower.difference(_CLASS_ORDER))
 
 def get_time_control_tabs(df: pd.DataFrame) -> Tuple[list[str], list[str]]:
     total_n = len(df)
-    class_counts = df["time_class"].fillna("unknown").str.lower().value_counts()
+    # normalized categorical (load_validate_df); classes absent from this scope count 0
+    class_counts = df["time_class"].value_counts(sort=False)
+    class_counts = class_counts[class_counts > 0]
     classes = _order_classes(class_counts.index.tolist())
-    top_labels = [f"All ({total_n})"] + [f"{c.title()} ({int(class_counts.get(c, 0))})" for c in classes]
+    counts = class_counts.reindex(classes, fill_value=0)
+    top_labels = [f"All ({total_n})"] + [f"{c.title()} ({n})" for c, n in zip(classes, counts.tolist())]
     return (top_labels, classes)
 
+def select_time_class(top_labels: list[str], classes: list[str], key_prefix: str) -> str:
+    """Radio in place of st.tabs: tabs execute every body, this only renders the selected class."""
+    options = ["all"] + classes
+    # labels without counts: they are part of the widget identity, and counts change with the filters
+    cls = st.radio(
+        "Time class",
+        options=options,
+        format_func=str.title,
+        index=0,
+        horizontal=True,
+        key=f"{key_prefix}_time_class",
+        label_visibility="collapsed",
+    )
+    st.caption(" · ".join(top_labels))
+    return cls
+
+def select_scope(df: pd.DataFrame, cls: str) -> pd.DataFrame:
+    # only the selected class is rendered; one mask on the categorical codes
+    return df[df["time_class"] == cls]
+
 def _apply_rated_filter(df_scope: pd.DataFrame, key_prefix: str) -> pd.DataFrame:
     if "rated" not in df_scope.columns:
         return df_scope